@@ -1,14 +1,18 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import os, sys
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
 
 # add repo root so imports work when running from repo root
 sys.path.insert(0, os.path.dirname(__file__))
 
 from parser.odds_parser import OmniscienceDataParser
-from ta.ta_engine import calculate_all_ta_indicators, calculate_all_ta_indicators as ta_wrapper  # alias
+from ta.ta_engine import RingBuf
 from engine.recommendations import RecommendationEngine
+from engine.pipeline import compute_game_indicators, lmf_forecast, make_executor, pool_workers
 from config.settings import config
 
 
@@ -22,13 +26,56 @@ if 'rec_engine' not in st.session_state:
     st.session_state['rec_engine'] = RecommendationEngine()
 if 'buffers' not in st.session_state:
     st.session_state['buffers'] = {}
+if 'ta_cache' not in st.session_state:
+    st.session_state['ta_cache'] = OrderedDict()
+
+
+def lru_touch(cache, key):
+    # LRU memo for TA/forecast results; keys change whenever a buffer receives a new tick
+    if key in cache:
+        cache.move_to_end(key)
+        return True
+    return False
+
+
+def lru_put(cache, key, val, cap):
+    cache[key] = val
+    cache.move_to_end(key)
+    while len(cache) > cap:
+        cache.popitem(last=False)
+
+
+@st.cache_resource
+def get_executor():
+    # one pool for the whole server process, shared by every session
+    return make_executor(config)
+
+
+def run_jobs(jobs):
+    # games are independent; only fan out when the batch outweighs the pool overhead
+    workers = pool_workers(config)
+    if workers < 2 or len(jobs) < config.rec_parallel_min_games:
+        return [compute_game_indicators(ta_jobs, lmf_jobs) for ta_jobs, lmf_jobs in jobs]
+    try:
+        # one chunk per worker keeps the per-task IPC round trips down
+        chunk = -(-len(jobs) // workers)
+        return list(get_executor().map(compute_game_indicators, *zip(*jobs), chunksize=chunk))
+    except BrokenProcessPool:
+        # a dead pool would stay cached; drop it so the next batch builds a fresh one
+        get_executor().shutdown(wait=False)
+        get_executor.clear()
+        return [compute_game_indicators(ta_jobs, lmf_jobs) for ta_jobs, lmf_jobs in jobs]
+
 
 with st.sidebar:
     parser_mode = st.radio('Parser mode', options=['5line', '4line'])
     run_auto = st.checkbox('Auto TA+Rec after parse', value=True)
+    if run_auto and lmf_forecast is None:
+        st.warning('LMF forecasts unavailable: ta.ta_engine has no lmf_forecast, so recommendations use TA only')
     clear_buf = st.button('Clear buffers')
     if clear_buf:
         st.session_state['buffers'] = {}
+        st.session_state['ta_cache'] = OrderedDict()
         st.success('buffers cleared')
 
 st.markdown('Paste your odds feed below (one feed type at a time).')
@@ -46,50 +93,69 @@ if col1.button('Parse Feed'):
         if df.empty:
             st.warning('No blocks parsed')
         else:
-            st.dataframe(df.fillna(''))
+            st.dataframe(df.style.format(na_rep=''))
             st.success(f'Parsed {len(df)} blocks')
 
             # push to buffers
-            now = pd.Timestamp.utcnow()
-            for _, r in df.iterrows():
-                gid = r.get('game_id')
-                def push(market, ip_val, point_val=None):
-                    if ip_val is None:
-                        return
-                    key = f"{gid}|{market}"
-                    buf = st.session_state['buffers'].setdefault(key, [])
-                    buf.append({'ip': float(ip_val), 'point': float(point_val) if point_val is not None else None, 'ts': now.isoformat()})
-                    if len(buf) > config.default_history_len:
-                        st.session_state['buffers'][key] = buf[-config.default_history_len:]
-
-                push('away_ml', r.get('away_ml_ip_raw'))
-                push('home_ml', r.get('home_ml_ip_raw'))
-                push('spread', r.get('favorite_ip_raw'), r.get('spread_points'))
-                push('total', r.get('over_ip_raw'), r.get('total_points'))
+            now_iso = df['parsed_at'].iat[0]  # the parser's batch timestamp, naive UTC like baseline
+            buffers = st.session_state['buffers']
+
+            def push(gid, market, ip_val, point_val=None):
+                if ip_val is None or np.isnan(ip_val):
+                    return
+                key = f"{gid}|{market}"
+                buf = buffers.get(key)
+                if buf is None:
+                    buf = buffers[key] = RingBuf(config.default_history_len)
+                buf.push(float(ip_val), float(point_val) if point_val is not None else None)
+
+            # reindex so 4-line feeds (no spread columns) still yield every field, as NaN
+            push_cols = ['game_id', 'away_ml_ip_raw', 'home_ml_ip_raw', 'favorite_ip_raw', 'spread_points', 'over_ip_raw', 'total_points']
+            for gid, away_ip, home_ip, fav_ip, sp_pts, over_ip, tot_pts in df.reindex(columns=push_cols).itertuples(index=False, name=None):
+                push(gid, 'away_ml', away_ip)
+                push(gid, 'home_ml', home_ip)
+                push(gid, 'spread', fav_ip, sp_pts)
+                push(gid, 'total', over_ip, tot_pts)
 
             if run_auto:
-                recs = []
-                for _, r in df.iterrows():
+                ta_cache = st.session_state['ta_cache']
+                cache_cap = 4 * len(df) * 4 * 2  # TA + forecast entries for 4 markets, ~4 parses deep
+                games = []  # (row, {market: ta key}, {market: lmf key})
+                jobs = []  # (ta_jobs, lmf_jobs) for games with cache misses
+                for r in df.to_dict(orient='records'):
                     gid = r.get('game_id')
-                    ta_indicators = {}
-                    forecasts = {}
+                    ta_keys, lmf_keys, ta_jobs, lmf_jobs = {}, {}, {}, {}
                     for market in ['away_ml','home_ml','spread','total']:
                         key = f"{gid}|{market}"
-                        buf = st.session_state['buffers'].get(key, [])
+                        buf = buffers.get(key)
                         if buf:
-                            series = [{'ip': p['ip'], 'point': p['point']} for p in buf]
-                            ta = calculate_all_ta_indicators(series, field='ip', point_field='point')
-                            ta_indicators[market] = ta
-                            if market in ('spread','total'):
-                                pts = [p['point'] for p in buf if p.get('point') is not None]
-                                ips = [p['ip'] for p in buf]
-                                if pts and ips:
-                                    # use lmf from ta_engine by calling its functions if exported (already inside ta module)
-                                    from ta.ta_engine import lmf_forecast
-                                    f = lmf_forecast(pts, ips, horizon_minutes=60)
-                                    forecasts[market] = f
-
-                    rec = st.session_state['rec_engine'].generate_recommendation(r.to_dict(), ta_indicators, forecasts)
+                            k = ta_keys[market] = ('ta', gid, market, buf.ticks)
+                            if not lru_touch(ta_cache, k):
+                                ta_jobs[k] = buf
+                            if lmf_forecast is not None and market in ('spread','total'):
+                                k = ('lmf', gid, market, buf.ticks)
+                                if lru_touch(ta_cache, k):
+                                    lmf_keys[market] = k
+                                else:
+                                    ips, pts = buf.view()
+                                    pts = pts[~np.isnan(pts)]
+                                    if pts.size and ips.size:
+                                        lmf_keys[market] = k
+                                        lmf_jobs[k] = (pts, ips)
+                    games.append((r, ta_keys, lmf_keys))
+                    if ta_jobs or lmf_jobs:
+                        jobs.append((ta_jobs, lmf_jobs))
+
+                results = run_jobs(jobs)
+                for ta_out, lmf_out in results:
+                    for k, v in (*ta_out.items(), *lmf_out.items()):
+                        lru_put(ta_cache, k, v, cache_cap)
+
+                recs = []
+                for row, ta_keys, lmf_keys in games:
+                    ta_indicators = {market: ta_cache[k] for market, k in ta_keys.items()}
+                    forecasts = {market: ta_cache[k] for market, k in lmf_keys.items()}
+                    rec = st.session_state['rec_engine'].generate_recommendation(row, ta_indicators, forecasts, now_iso=now_iso)
                     recs.append(rec)
 
                 rec_df = pd.DataFrame(recs)
@@ -100,12 +166,7 @@ if col2.button('Parse Splits'):
     if not splits.strip():
         st.warning('No splits text')
     else:
-        blocks = [b for b in splits.split('\n\n') if b.strip()]
-        parsed = []
-        for b in blocks:
-            p = st.session_state['parser'].parse_splits_block(b)
-            if p:
-                parsed.append(p)
+        parsed = st.session_state['parser'].parse_splits(splits)
         if parsed:
             st.dataframe(pd.DataFrame(parsed))
         else:
@@ -21,4 +21,12 @@ class Config:
     # Kelly parameters
     kelly_fraction_cap = 0.20
 
+    # Auto-rec parallelism
+    # a game's TA bundle is ~0.38 ms; handing it to a process worker costs the server ~0.12 ms
+    # (pickle job, unpickle result) plus ~5 ms per batch, so with 2+ CPUs the pool pays off
+    # from roughly 40 games. Single-CPU hosts always run inline.
+    rec_executor = 'process'  # 'process' or 'thread'
+    rec_max_workers = None  # None -> os.cpu_count()
+    rec_parallel_min_games = 40  # smaller batches run inline
+
 config = Config()
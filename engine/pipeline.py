@@ -0,0 +1,39 @@
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Tuple
+import numpy as np
+from config.settings import config
+from ta.ta_engine import RingBuf, calculate_all_ta_indicators
+
+try:
+    from ta.ta_engine import lmf_forecast
+except ImportError:  # forecasting is optional; TA and recommendations run without it
+    lmf_forecast = None
+
+
+def compute_game_indicators(ta_jobs: Dict[Hashable, RingBuf],
+                            lmf_jobs: Dict[Hashable, Tuple[np.ndarray, np.ndarray]]) -> Tuple[Dict[Hashable, Any], Dict[Hashable, Any]]:
+    """TA bundles and LMF forecasts one game still needs, keyed like the jobs.
+
+    Module-level so a process pool can pickle it; every job is independent.
+    """
+    ta = {key: calculate_all_ta_indicators(buf) for key, buf in ta_jobs.items()}
+    forecasts = {}
+    if lmf_forecast is not None:
+        forecasts = {key: lmf_forecast(pts, ips, horizon_minutes=60) for key, (pts, ips) in lmf_jobs.items()}
+    return ta, forecasts
+
+
+def pool_workers(cfg=config) -> int:
+    return cfg.rec_max_workers or os.cpu_count() or 1
+
+
+def make_executor(cfg=config) -> Executor:
+    workers = pool_workers(cfg)
+    if cfg.rec_executor == 'thread':
+        # only the small jitted kernels drop the GIL (~2% of a TA bundle), so threads barely scale;
+        # kept for hosts that can't spawn processes
+        return ThreadPoolExecutor(max_workers=workers)
+    # spawn rather than fork: the Streamlit server process is multithreaded
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
@@ -1,14 +1,15 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 from config.settings import config
-import numpy as np
+import math
 
 
 class RecommendationEngine:
     def __init__(self, cfg=config):
         self.cfg = cfg
 
-    def generate_recommendation(self, game_row: Dict[str, Any], ta_indicators: Dict[str, Any], forecasts: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_recommendation(self, game_row: Dict[str, Any], ta_indicators: Dict[str, Any], forecasts: Dict[str, Any],
+                                now_iso: Optional[str] = None) -> Dict[str, Any]:
         score = 0.0
         narrative = []
         triggered = []
@@ -20,7 +21,7 @@ class RecommendationEngine:
             mom_v = mom.get('MOM_V') if mom else 0.0
             mom_a = mom.get('MOM_A') if mom else 0.0
             if mom_v is not None:
-                score += np.sign(mom_v) * min(0.5, abs(mom_v) * 100)
+                score += math.copysign(min(0.5, abs(mom_v) * 100), mom_v)
                 narrative.append(f"Spread MOM-V: {mom_v:.6f}")
                 triggered.append('spread_momentum')
             # steam
@@ -36,7 +37,7 @@ class RecommendationEngine:
                 t = ta_indicators[side]
                 momv = t.get('momentum', {}).get('MOM_V') if t.get('momentum') else 0.0
                 if momv:
-                    score += np.sign(momv) * min(0.4, abs(momv) * 120)
+                    score += math.copysign(min(0.4, abs(momv) * 120), momv)
                     triggered.append(f"{side}_momentum")
 
         # Forecasts: if forecasts indicate imminent movement that improves edge, increase score
@@ -47,7 +48,7 @@ class RecommendationEngine:
             conf = f.get('confidence', 0.0)
             if pm and abs(pm) > 0.3 and conf > 0.6:
                 narrative.append(f"Forecast {mk}: move {pm:.2f} pts (conf {conf:.2f})")
-                score += 0.2 * np.sign(pm)
+                score += math.copysign(0.2, pm)
 
         # Normalize score into confidence
         confidence = 0.5 + score
@@ -77,5 +78,5 @@ class RecommendationEngine:
             'narrative': '\n'.join(narrative),
             'triggered_indicators': triggered,
             'indicator_summary': ta_indicators,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': now_iso or datetime.utcnow().isoformat()
         }
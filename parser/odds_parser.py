@@ -1,9 +1,65 @@
 import re
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+import numpy as np
 import pandas as pd
 from config.settings import config
 
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?\d+\.?\d*")
+_PCT_RE = re.compile(r"\d+\.?\d*")
+_ML_RE = re.compile(r"[+-]?\d+")
+# One splits block: starts the text (after any blank lines) or follows a blank line;
+# lines 1-3 ignored, lines 4-7 each contribute their first number, or None when the
+# line has none ('--', 'N/A')
+_SPLITS_PCT_LINE = r"(?=[ \t]*\S)(?:[^\n]*?(\d*\.?\d+))?[^\n]*"
+_SPLITS_RE = re.compile(
+    r"(?:\A(?:[ \t]*\n)*|\n(?:[ \t]*\n)+)"
+    r"(?:[ \t]*\S[^\n]*\n){3}"
+    + r"\n".join([_SPLITS_PCT_LINE] * 4)
+)
+SPLITS_FIELDS = ('away_bet_pct', 'home_bet_pct', 'away_money_pct', 'home_money_pct')
+
+# Output column order for each block type
+SCHEMA_5LINE = (
+    'game_id', 'date', 'time', 'favorite_team', 'spread_points',
+    'favorite_ip_raw', 'dog_ip_raw', 'spread_vig', 'spread_vig_opp',
+    'total_points', 'total_side', 'over_ip_raw', 'under_ip_raw', 'total_vig', 'total_vig_opp',
+    'away_ml', 'home_ml', 'away_ml_ip_raw', 'home_ml_ip_raw', 'parsed_at',
+)
+SCHEMA_4LINE = (
+    'game_id', 'date', 'time', 'away_ml', 'home_ml', 'away_ml_ip_raw', 'home_ml_ip_raw',
+    'total_points', 'total_vig', 'total_vig_opp', 'over_ip_raw', 'under_ip_raw',
+    'runline_points', 'runline_vig', 'runline_vig_opp', 'parsed_at',
+)
+
+# Columns filled in once per feed (NumPy odds conversions, batch timestamp) rather than per block
+_OPPOSITE_VIGS = (('spread_vig', 'spread_vig_opp'), ('total_vig', 'total_vig_opp'), ('runline_vig', 'runline_vig_opp'))
+_TWO_WAY_IPS = (
+    ('spread_vig', 'spread_vig_opp', 'favorite_ip_raw', 'dog_ip_raw'),
+    ('total_vig', 'total_vig_opp', 'over_ip_raw', 'under_ip_raw'),
+    ('away_ml', 'home_ml', 'away_ml_ip_raw', 'home_ml_ip_raw'),
+)
+_DERIVED = {c for _, c in _OPPOSITE_VIGS} | {c for pair in _TWO_WAY_IPS for c in pair[2:]} | {'parsed_at'}
+
+# Field order of the tuples returned by _parse_5line / _parse_4line
+ROW_5LINE = tuple(c for c in SCHEMA_5LINE if c not in _DERIVED)
+ROW_4LINE = tuple(c for c in SCHEMA_4LINE if c not in _DERIVED)
+
+_FLOAT_COLUMNS = (
+    'spread_points', 'favorite_ip_raw', 'dog_ip_raw', 'total_points', 'over_ip_raw', 'under_ip_raw',
+    'away_ml_ip_raw', 'home_ml_ip_raw', 'runline_points',
+)
+_INT_COLUMNS = (
+    'spread_vig', 'spread_vig_opp', 'total_vig', 'total_vig_opp', 'away_ml', 'home_ml',
+    'runline_vig', 'runline_vig_opp',
+)
+COLUMN_DTYPES = {
+    **{c: 'float64' for c in _FLOAT_COLUMNS},
+    **{c: 'Int64' for c in _INT_COLUMNS},
+    'favorite_team': 'category',
+}
+
 
 class OmniscienceDataParser:
     """Parser that strictly maps 5-line, 4-line, and splits blocks and normalizes
@@ -11,7 +67,7 @@ class OmniscienceDataParser:
 
     def __init__(self, cfg=config):
         self.cfg = cfg
-        self.parsed_data: List[Dict[str, Any]] = []
+        self.parsed_data: List[pd.DataFrame] = []
         self.splits_data: List[Dict[str, Any]] = []
 
     # --------------------------
@@ -26,39 +82,25 @@ class OmniscienceDataParser:
             return None
         if s.lower() == "even":
             return 100
-        s = s.replace('+', '')
-        m = re.search(r"-?\d+", s)
+        m = _INT_RE.search(s)
         return int(m.group(0)) if m else None
 
     @staticmethod
-    def _american_to_prob_raw(odds: Optional[int]) -> Optional[float]:
-        if odds is None:
-            return None
-        if odds > 0:
-            return 100.0 / (odds + 100.0)
-        else:
-            return float(-odds) / (float(-odds) + 100.0)
+    def _american_to_prob_raw(odds: np.ndarray) -> np.ndarray:
+        """Raw implied probability for an array of American odds (NaN stays NaN)."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(odds > 0, 100.0 / (odds + 100.0), -odds / (-odds + 100.0))
 
     @staticmethod
-    def _normalize_two_way(a_odds: Optional[int], b_odds: Optional[int]) -> (Optional[float], Optional[float]):
-        """Return normalized probabilities (p_a, p_b) that sum to 1 given two American odds.
-        If one side missing, return raw prob for present side and None for other.
+    def _normalize_two_way(a_odds: np.ndarray, b_odds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return normalized probabilities (p_a, p_b) that sum to 1 given two arrays of American odds.
+        A missing (NaN) side counts as 0; rows with both sides missing are NaN.
         """
-        if a_odds is None and b_odds is None:
-            return None, None
-        a_raw = OmniscienceDataParser._american_to_prob_raw(a_odds) if a_odds is not None else 0.0
-        b_raw = OmniscienceDataParser._american_to_prob_raw(b_odds) if b_odds is not None else 0.0
-        total = (a_raw or 0.0) + (b_raw or 0.0)
-        if total == 0:
-            # fallback: if one side is present and other None
-            return (a_raw, None) if b_odds is None else (None, b_raw)
-        return (a_raw / total, b_raw / total)
-
-    @staticmethod
-    def _calc_opposite_vig(vig: Optional[int]) -> Optional[int]:
-        if vig is None:
-            return None
-        return -220 - vig
+        a_raw = np.nan_to_num(OmniscienceDataParser._american_to_prob_raw(a_odds))
+        b_raw = np.nan_to_num(OmniscienceDataParser._american_to_prob_raw(b_odds))
+        total = a_raw + b_raw
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(total > 0, a_raw / total, np.nan), np.where(total > 0, b_raw / total, np.nan)
 
     @staticmethod
     def _parse_percentage(tok: str) -> Optional[float]:
@@ -68,7 +110,7 @@ class OmniscienceDataParser:
         try:
             return float(t)
         except Exception:
-            m = re.search(r"\d+\.?\d*", t)
+            m = _PCT_RE.search(t)
             return float(m.group(0)) if m else None
 
     # --------------------------
@@ -78,45 +120,73 @@ class OmniscienceDataParser:
         lines = [ln.strip() for ln in text_feed.splitlines() if ln.strip() != '']
         if not lines:
             return pd.DataFrame()
+        now_iso = datetime.utcnow().isoformat()  # one timestamp for the whole batch
 
         start_idx = 1 if self.cfg.ignore_header_rows and len(lines) > 0 else 0
-        cur: List[str] = []
-        blocks: List[List[str]] = []
-        i = start_idx
-        while i < len(lines):
-            cur.append(lines[i])
-            i += 1
-            # decide flush
-            if block_type == '5line':
-                expect = 5
-            elif block_type == '4line':
-                expect = 4
-            else:
-                expect = 5 if len(cur) >= 5 and self.cfg.parse_5_line_blocks else (4 if len(cur) >= 4 and self.cfg.parse_4_line_blocks else None)
-            if expect and len(cur) == expect:
-                blocks.append(cur.copy())
-                cur = []
-        if cur and len(cur) in (4,5):
-            blocks.append(cur.copy())
-
-        parsed = []
+        # block size is fixed for the whole call; in auto mode the old grow-and-flush loop
+        # always flushed at the first enabled size it reached, i.e. 4 before 5
+        if block_type == '5line':
+            size = 5
+        elif block_type == '4line':
+            size = 4
+        else:
+            size = 4 if self.cfg.parse_4_line_blocks else (5 if self.cfg.parse_5_line_blocks else None)
+        if size:
+            blocks = [lines[i:i + size] for i in range(start_idx, len(lines), size)]
+        else:
+            blocks = [lines[start_idx:]]
+        # a trailing partial block is only kept if it is itself a whole 4- or 5-line block
+        if blocks and len(blocks[-1]) not in (4, 5):
+            blocks.pop()
+
+        # accumulate column-wise; rows are tuples ordered like their ROW_* field list
+        cols: Dict[str, Any] = {}
+        schemas: List[Tuple[str, ...]] = []
+        n = 0
         for b in blocks:
             if len(b) == 5 and self.cfg.parse_5_line_blocks:
-                p = self._parse_5line(b)
-            elif len(b) == 4 and self.cfg.parse_4line_blocks:
-                p = self._parse_4line(b)
+                schema, fields, row = SCHEMA_5LINE, ROW_5LINE, self._parse_5line(b)
+            elif len(b) == 4 and self.cfg.parse_4_line_blocks:
+                schema, fields, row = SCHEMA_4LINE, ROW_4LINE, self._parse_4line(b)
             else:
-                p = None
-            if p:
-                parsed.append(p)
-                self.parsed_data.append(p)
+                row = None
+            if row is None:
+                continue
+            if schema not in schemas:
+                schemas.append(schema)
+            for k, v in zip(fields, row):
+                cols.setdefault(k, [None] * n).append(v)
+            n += 1
+            if len(cols) > len(fields):
+                # mixed 5/4-line feed: pad the columns this block type doesn't have
+                for col in cols.values():
+                    if len(col) < n:
+                        col.append(None)
+
+        if not n:
+            return pd.DataFrame()
 
-        return pd.DataFrame(parsed)
+        # odds -> opposite vigs and normalized IPs, once per column
+        for k in ('spread_vig', 'total_vig', 'runline_vig', 'away_ml', 'home_ml'):
+            if k in cols:
+                cols[k] = np.array(cols[k], dtype=np.float64)
+        for vig, opp in _OPPOSITE_VIGS:
+            if vig in cols:
+                cols[opp] = -220.0 - cols[vig]
+        for a, b, a_ip, b_ip in _TWO_WAY_IPS:
+            if a in cols:
+                cols[a_ip], cols[b_ip] = self._normalize_two_way(cols[a], cols[b])
+        cols['parsed_at'] = [now_iso] * n
+
+        columns = list(dict.fromkeys(c for schema in schemas for c in schema))
+        df = pd.DataFrame(cols, columns=columns, copy=False).astype({k: t for k, t in COLUMN_DTYPES.items() if k in cols})
+        self.parsed_data.append(df)
+        return df
 
     # --------------------------
     # 5-line mapping
     # --------------------------
-    def _parse_5line(self, block: List[str]) -> Optional[Dict[str, Any]]:
+    def _parse_5line(self, block: List[str]) -> Optional[Tuple[Any, ...]]:
         # block lines: 1 date time favorite spread | 2 spread vig | 3 total o/u | 4 total vig | 5 awayML homeML
         try:
             t1 = block[0].split()
@@ -128,8 +198,6 @@ class OmniscienceDataParser:
 
             spread_vig_raw = block[1].strip()
             spread_vig = self._sanitize_int_token(spread_vig_raw)
-            spread_vig_opp = self._calc_opposite_vig(spread_vig)
-            fav_ip_raw, dog_ip_raw = self._normalize_two_way(spread_vig, spread_vig_opp)
 
             total_token = block[2].strip()
             total_side = None
@@ -140,44 +208,22 @@ class OmniscienceDataParser:
                 total_points = self._extract_point_value(total_token)
 
             total_vig = self._sanitize_int_token(block[3])
-            total_vig_opp = self._calc_opposite_vig(total_vig)
-            over_ip_raw, under_ip_raw = self._normalize_two_way(total_vig, total_vig_opp)
 
-            ml_matches = re.findall(r"[+-]?\d+", block[4])
+            ml_matches = _ML_RE.findall(block[4])
             away_ml = self._sanitize_int_token(ml_matches[0]) if len(ml_matches) > 0 else None
             home_ml = self._sanitize_int_token(ml_matches[1]) if len(ml_matches) > 1 else None
-            away_ml_ip_raw, home_ml_ip_raw = self._normalize_two_way(away_ml, home_ml)
-
-            parsed = {
-                'game_id': f"{date_token}|{time_token}|{favorite_team}",
-                'date': date_token,
-                'time': time_token,
-                'favorite_team': favorite_team,
-                'spread_points': spread_points,
-                'favorite_ip_raw': fav_ip_raw,
-                'dog_ip_raw': dog_ip_raw,
-                'spread_vig': spread_vig,
-                'spread_vig_opp': spread_vig_opp,
-                'total_points': total_points,
-                'total_side': total_side,
-                'over_ip_raw': over_ip_raw,
-                'under_ip_raw': under_ip_raw,
-                'total_vig': total_vig,
-                'total_vig_opp': total_vig_opp,
-                'away_ml': away_ml,
-                'home_ml': home_ml,
-                'away_ml_ip_raw': away_ml_ip_raw,
-                'home_ml_ip_raw': home_ml_ip_raw,
-                'parsed_at': datetime.utcnow().isoformat()
-            }
-            return parsed
+
+            return (
+                f"{date_token}|{time_token}|{favorite_team}", date_token, time_token, favorite_team, spread_points,
+                spread_vig, total_points, total_side, total_vig, away_ml, home_ml,
+            )
         except Exception:
             return None
 
     # --------------------------
     # 4-line mapping
     # --------------------------
-    def _parse_4line(self, block: List[str]) -> Optional[Dict[str, Any]]:
+    def _parse_4line(self, block: List[str]) -> Optional[Tuple[Any, ...]]:
         # line1: date time awayML homeML total | 2 total vig | 3 team runline | 4 runline vig
         try:
             t1 = block[0].split()
@@ -186,39 +232,19 @@ class OmniscienceDataParser:
             date_token, time_token = t1[0], t1[1]
             away_ml = self._sanitize_int_token(t1[2])
             home_ml = self._sanitize_int_token(t1[3])
-            away_ml_ip_raw, home_ml_ip_raw = self._normalize_two_way(away_ml, home_ml)
             total_token = t1[4]
             total_points = self._extract_point_value(total_token)
 
             total_vig = self._sanitize_int_token(block[1])
-            total_vig_opp = self._calc_opposite_vig(total_vig)
-            over_ip_raw, under_ip_raw = self._normalize_two_way(total_vig, total_vig_opp)
 
             rtokens = block[2].split()
             runline_points = self._extract_point_value(rtokens[1]) if len(rtokens) >= 2 else None
             runline_vig = self._sanitize_int_token(block[3])
-            runline_vig_opp = self._calc_opposite_vig(runline_vig)
-            runline_vig_ip, runline_vig_opp_ip = self._normalize_two_way(runline_vig, runline_vig_opp)
-
-            parsed = {
-                'game_id': f"{date_token}|{time_token}|{away_ml}|{home_ml}",
-                'date': date_token,
-                'time': time_token,
-                'away_ml': away_ml,
-                'home_ml': home_ml,
-                'away_ml_ip_raw': away_ml_ip_raw,
-                'home_ml_ip_raw': home_ml_ip_raw,
-                'total_points': total_points,
-                'total_vig': total_vig,
-                'total_vig_opp': total_vig_opp,
-                'over_ip_raw': over_ip_raw,
-                'under_ip_raw': under_ip_raw,
-                'runline_points': runline_points,
-                'runline_vig': runline_vig,
-                'runline_vig_opp': runline_vig_opp,
-                'parsed_at': datetime.utcnow().isoformat()
-            }
-            return parsed
+
+            return (
+                f"{date_token}|{time_token}|{away_ml}|{home_ml}", date_token, time_token,
+                away_ml, home_ml, total_points, total_vig, runline_points, runline_vig,
+            )
         except Exception:
             return None
 
@@ -243,6 +269,16 @@ class OmniscienceDataParser:
         self.splits_data.append(parsed)
         return parsed
 
+    def parse_splits(self, text: str) -> List[Dict[str, Any]]:
+        """Parse every splits block in a feed (blocks separated by a blank line) in one regex pass."""
+        now_iso = datetime.utcnow().isoformat()
+        parsed = [
+            dict(zip(SPLITS_FIELDS, (float(g) if g is not None else None for g in m.groups())), parsed_at=now_iso)
+            for m in _SPLITS_RE.finditer(text)
+        ]
+        self.splits_data.extend(parsed)
+        return parsed
+
     # --------------------------
     # small helper
     # --------------------------
@@ -250,5 +286,5 @@ class OmniscienceDataParser:
     def _extract_point_value(token: str) -> Optional[float]:
         if token is None:
             return None
-        m = re.search(r"-?\d+\.?\d*", str(token))
+        m = _FLOAT_RE.search(str(token))
         return float(m.group(0)) if m else None
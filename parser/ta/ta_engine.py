@@ -1,213 +1,426 @@
 import numpy as np
-from typing import List, Dict, Any, Optional
+from numba import njit
+from typing import Dict, Any, Optional, Sequence, Tuple
 
 # Basic IP/point ta utilities for Omniscience
 
-def momentum_from_ips(values: List[float], period: int = 3) -> Dict[str, Optional[float]]:
-    arr = np.array(values)
-    if len(arr) < period + 1:
+class RingBuf:
+    """Fixed-capacity per-market history stored as parallel float64 arrays.
+
+    Missing points are stored as NaN. No per-tick timestamp is kept; ``ticks``
+    counts every push ever made, so it changes whenever the contents do.
+    Every sample is written twice (at ``head`` and ``head + cap``), so ``view()``
+    is always a contiguous oldest-first slice and never has to stitch the
+    wrapped halves together.
+
+    Running sums over the last 20 (z-score / Bollinger) and 10 (SMA) IPs are
+    updated on push, so those indicators are O(1) per tick. The sums are kept
+    relative to ``shift`` to limit cancellation and are recomputed exactly every
+    time ``head`` wraps.
+    """
+    __slots__ = ('ip', 'pt', 'head', 'n', 'cap', 'ticks', 'shift', 'sum20', 'sumsq20', 'sum10')
+
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.ip = np.empty(2 * cap, dtype=np.float64)
+        self.pt = np.empty(2 * cap, dtype=np.float64)
+        self.head = 0
+        self.n = 0
+        self.ticks = 0
+        self.shift = 0.0
+        self.sum20 = 0.0
+        self.sumsq20 = 0.0
+        self.sum10 = 0.0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def push(self, ip: float, pt: Optional[float] = None) -> None:
+        h, cap = self.head, self.cap
+        if self.n == 0:
+            self.shift = ip
+        d = ip - self.shift
+        self.sum20 += d
+        self.sumsq20 += d * d
+        self.sum10 += d
+        # evict the samples leaving each window (read before this push overwrites slot h)
+        w20, w10 = min(20, cap), min(10, cap)
+        if self.n >= w20:
+            old = self.ip[h + cap - w20] - self.shift
+            self.sum20 -= old
+            self.sumsq20 -= old * old
+        if self.n >= w10:
+            self.sum10 -= self.ip[h + cap - w10] - self.shift
+
+        pt = np.nan if pt is None else pt
+        self.ip[h] = self.ip[h + cap] = ip
+        self.pt[h] = self.pt[h + cap] = pt
+        self.ticks += 1
+        self.head = (h + 1) % cap
+        if self.n < cap:
+            self.n += 1
+        if self.head == 0:
+            self._resync()
+
+    def _resync(self) -> None:
+        ip = self.view()[0]
+        self.shift = float(ip[-1])
+        tail20 = ip[-20:] - self.shift
+        self.sum20 = float(tail20.sum())
+        self.sumsq20 = float(tail20 @ tail20)
+        self.sum10 = float(tail20[-10:].sum())
+
+    def view(self) -> Tuple[np.ndarray, np.ndarray]:
+        end = self.head + self.cap
+        return self.ip[end - self.n:end], self.pt[end - self.n:end]
+
+    def mean10(self) -> Optional[float]:
+        """Mean of the last min(n, 10) IPs."""
+        if not self.n:
+            return None
+        return self.shift + self.sum10 / min(self.n, 10)
+
+    def mean20(self) -> Optional[float]:
+        if self.n < 20:
+            return None
+        return self.shift + self.sum20 / 20
+
+    def std20(self) -> Optional[float]:
+        if self.n < 20:
+            return None
+        msq = self.sumsq20 / 20
+        var = msq - (self.sum20 / 20) ** 2
+        # what's left after cancellation on a flat window is rounding noise, not variance
+        if var <= 1e-12 * msq:
+            return 0.0
+        return float(np.sqrt(var))
+
+
+def _as_array(values) -> np.ndarray:
+    """Return ``values`` as a contiguous float64 array (no copy if it already is one)."""
+    if isinstance(values, RingBuf):
+        return values.view()[0]
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _tail_stats(values, lookback: int = 20) -> Optional[Tuple[float, float]]:
+    """Mean and std of the last ``lookback`` values, shared by z-score and Bollinger."""
+    if isinstance(values, RingBuf) and lookback == 20:
+        return (values.mean20(), values.std20()) if len(values) >= 20 else None
+    arr = _as_array(values)
+    if arr.size < lookback:
+        return None
+    tail = arr[-lookback:]
+    return float(tail.mean()), float(tail.std())
+
+
+def _median(arr: np.ndarray) -> float:
+    """Median via O(n) selection instead of np.median's sort (arr must be non-empty)."""
+    k = arr.size // 2
+    if arr.size % 2:
+        return float(np.partition(arr, k)[k])
+    part = np.partition(arr, (k - 1, k))
+    return float(0.5 * (part[k - 1] + part[k]))
+
+
+def momentum_from_ips(values: Sequence[float], period: int = 3) -> Dict[str, Optional[float]]:
+    arr = _as_array(values)
+    if arr.size < period + 1:
         return {'MOM_V': None, 'MOM_A': None}
     mom_v = (arr[-1] - arr[-period-1]) / period
     mom_a = None
-    if len(arr) >= 2 * period + 1:
+    if arr.size >= 2 * period + 1:
         prev_v = (arr[-period-1] - arr[-2*period-1]) / period
         mom_a = (mom_v - prev_v) / period
     return {'MOM_V': float(mom_v), 'MOM_A': float(mom_a) if mom_a is not None else None}
 
 
-def rsi_from_ips(values: List[float], period: int = 14) -> Optional[float]:
-    x = np.array(values)
-    if len(x) < period + 1:
+def rsi_from_ips(values: Sequence[float], period: int = 14) -> Optional[float]:
+    x = _as_array(values)
+    if x.size < period + 1:
         return None
-    deltas = np.diff(x)
-    gains = np.where(deltas > 0, deltas, 0)
-    losses = np.where(deltas < 0, -deltas, 0)
-    avg_gain = np.mean(gains[-period:])
-    avg_loss = np.mean(losses[-period:])
+    deltas = np.diff(x[-(period + 1):])
+    avg_gain = np.maximum(deltas, 0.0).mean()
+    avg_loss = np.maximum(-deltas, 0.0).mean()
     if avg_loss == 0:
         return 100.0
     rs = avg_gain / avg_loss
-    return 100.0 - (100.0 / (1.0 + rs))
+    return float(100.0 - (100.0 / (1.0 + rs)))
 
 
-def z_score(values: List[float], lookback: int = 20) -> Optional[float]:
-    arr = np.array(values)
-    if len(arr) < lookback:
+def z_score(values: Sequence[float], lookback: int = 20, stats: Optional[Tuple[float, float]] = None) -> Optional[float]:
+    arr = _as_array(values)
+    if arr.size < lookback:
         return None
-    mu = np.mean(arr[-lookback:])
-    sd = np.std(arr[-lookback:])
+    mu, sd = stats if stats is not None else _tail_stats(arr, lookback)
     if sd == 0:
         return 0.0
     return float((arr[-1] - mu) / sd)
 
 
-def sma(values: List[float], period: int = 10) -> Optional[float]:
-    if len(values) < 1:
+def sma(values: Sequence[float], period: int = 10) -> Optional[float]:
+    if isinstance(values, RingBuf) and period == 10:
+        return values.mean10()
+    arr = _as_array(values)
+    if arr.size < 1:
         return None
-    return float(np.mean(values[-period:]))
+    return float(arr[-period:].mean())
 
 
-def ema(values: List[float], period: int = 10) -> Optional[float]:
-    arr = np.array(values)
-    if len(arr) < 1:
-        return None
-    alpha = 2.0 / (period + 1.0)
-    ema_v = arr[0]
-    for v in arr[1:]:
-        ema_v = alpha * v + (1 - alpha) * ema_v
-    return float(ema_v)
+@njit(cache=True, fastmath=True, nogil=True)
+def _ema_kernel(arr, alpha):
+    e = arr[0]
+    for i in range(1, arr.shape[0]):
+        e = alpha * arr[i] + (1.0 - alpha) * e
+    return e
 
 
-def adaptive_ma(values: List[float], base_period: int = 10, max_period: int = 30, sensitivity: float = 2.0) -> Optional[float]:
-    if not values:
-        return None
-    arr = np.array(values)
-    if len(arr) < base_period:
-        return float(np.mean(arr))
-    vol = np.std(arr[-base_period:])
-    if vol == 0:
+@njit(cache=True, fastmath=True, nogil=True)
+def _adaptive_ma_kernel(arr, base_period, max_period, sensitivity):
+    n = arr.shape[0]
+    if n < base_period:
+        return arr.mean()
+    vol = arr[n - base_period:].std()
+    if vol == 0.0:
         eff = 0.0
     else:
-        direction = abs(arr[-1] - arr[-base_period])
+        direction = abs(arr[n - 1] - arr[n - base_period])
         eff = direction / (vol * np.sqrt(base_period))
     adaptive_period = base_period + int((max_period - base_period) * eff * sensitivity)
     adaptive_period = max(base_period, min(max_period, adaptive_period))
-    return float(np.mean(arr[-adaptive_period:]))
+    return arr[n - min(adaptive_period, n):].mean()
 
 
-def bollinger_width(values: List[float], lookback: int = 20) -> Optional[float]:
-    arr = np.array(values)
-    if len(arr) < lookback:
+def ema(values: Sequence[float], period: int = 10) -> Optional[float]:
+    arr = _as_array(values)
+    if arr.size < 1:
         return None
-    mu = np.mean(arr[-lookback:])
-    sd = np.std(arr[-lookback:])
+    alpha = 2.0 / (period + 1.0)
+    return float(_ema_kernel(arr, alpha))
+
+
+def adaptive_ma(values: Sequence[float], base_period: int = 10, max_period: int = 30, sensitivity: float = 2.0) -> Optional[float]:
+    arr = _as_array(values)
+    if arr.size < 1:
+        return None
+    return float(_adaptive_ma_kernel(arr, int(base_period), int(max_period), float(sensitivity)))
+
+
+def bollinger_width(values: Sequence[float], lookback: int = 20, stats: Optional[Tuple[float, float]] = None) -> Optional[float]:
+    arr = _as_array(values)
+    if arr.size < lookback:
+        return None
+    mu, sd = stats if stats is not None else _tail_stats(arr, lookback)
     return float((mu + 2 * sd) - (mu - 2 * sd))
 
 
-def atr_on_points(points: List[float], lookback: int = 14) -> Optional[float]:
-    if len(points) < 2:
+def atr_on_points(points: Sequence[float], lookback: int = 14) -> Optional[float]:
+    arr = _as_array(points)
+    if arr.size < 2:
         return None
-    tr = np.abs(np.diff(points))
-    if len(tr) < lookback:
-        return float(np.mean(tr))
-    return float(np.mean(tr[-lookback:]))
+    tr = np.abs(np.diff(arr[-(lookback + 1):]))
+    return float(tr.mean())
 
 
-def fibonacci_levels(points: List[float], lookback: int = 50) -> Dict[str, float]:
-    out = {}
-    if len(points) < 2:
-        return out
-    s = points[-lookback:]
-    high = max(s)
-    low = min(s)
-    diff = high - low if high != low else 1.0
-    out = {
-        '0.0': high,
-        '0.236': high - 0.236 * diff,
-        '0.382': high - 0.382 * diff,
-        '0.5': high - 0.5 * diff,
-        '0.618': high - 0.618 * diff,
-        '0.786': high - 0.786 * diff,
-        '1.0': low
-    }
-    return out
+_FIB_RETR = np.array([0.0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0])
+_FIB_RETR_LABELS = ('0.0', '0.236', '0.382', '0.5', '0.618', '0.786', '1.0')
+_FIB_EXT = np.array([0.272, 0.414, 0.618, 1.0, 1.618])
+_FIB_EXT_LABELS = ('1.272', '1.414', '1.618', '2.0', '2.618')
 
 
-def fibonacci_extensions(points: List[float], lookback: int = 50) -> Dict[str, float]:
-    out = {}
-    if len(points) < 2:
-        return out
-    s = points[-lookback:]
-    high = max(s)
-    low = min(s)
+def _fib_range(points: Sequence[float], lookback: int) -> Optional[Tuple[float, float, float]]:
+    arr = _as_array(points)
+    if arr.size < 2:
+        return None
+    s = arr[-lookback:]
+    high = float(s.max())
+    low = float(s.min())
     diff = high - low if high != low else 1.0
-    out = {
-        '1.272': high + 0.272 * diff,
-        '1.414': high + 0.414 * diff,
-        '1.618': high + 0.618 * diff,
-        '2.0': high + 1.0 * diff,
-        '2.618': high + 1.618 * diff
-    }
-    return out
+    return high, low, diff
 
 
-def detect_steam_movement_advanced(values_ip: List[float], values_points: Optional[List[float]] = None, splits: Optional[Dict] = None) -> Dict[str, Any]:
-    """Return steam detection summary. Uses z-score, momentum, volatility, and splits if present."""
-    out = {'steam': False, 'confidence': 0.0, 'signals': []}
-    if not values_ip or len(values_ip) < 6:
-        return out
-    zs = z_score(values_ip, lookback=20) or 0.0
-    mom = momentum_from_ips(values_ip, period=3)
+def fibonacci_levels(points: Sequence[float], lookback: int = 50) -> Dict[str, float]:
+    rng = _fib_range(points, lookback)
+    if rng is None:
+        return {}
+    high, low, diff = rng
+    levels = high - _FIB_RETR * diff
+    levels[-1] = low
+    return dict(zip(_FIB_RETR_LABELS, levels.tolist()))
+
+
+def fibonacci_extensions(points: Sequence[float], lookback: int = 50) -> Dict[str, float]:
+    rng = _fib_range(points, lookback)
+    if rng is None:
+        return {}
+    high, _, diff = rng
+    return dict(zip(_FIB_EXT_LABELS, (high + _FIB_EXT * diff).tolist()))
+
+
+_STEAM_LABELS = np.array(['zscore', 'momentum', 'volatility', 'sharp_splits'])
+_STEAM_WEIGHTS = np.array([1.0, 1.0, 0.5, 1.0])
+
+
+def _steam_summary(lanes: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    score = float(lanes @ _STEAM_WEIGHTS) if lanes is not None else 0.0
+    confidence = min(1.0, score / 3.0)
+    signals = _STEAM_LABELS[lanes].tolist() if lanes is not None else []
+    return {'steam': confidence > 0.4, 'confidence': confidence, 'signals': signals}
+
+
+def detect_steam_movement_advanced(values_ip: Sequence[float], values_points: Optional[Sequence[float]] = None, splits: Optional[Dict] = None,
+                                   stats: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
+    """Return steam detection summary. Uses z-score, momentum, volatility, and splits if present.
+
+    ``stats`` is an optional precomputed (mean, std) of the z-score lookback window.
+    """
+    arr = _as_array(values_ip)
+    if arr.size < 6:
+        return _steam_summary()
+    zs = z_score(arr, lookback=20, stats=stats) or 0.0
+    mom = momentum_from_ips(arr, period=3)
     mom_v = mom.get('MOM_V') or 0.0
-    vol = np.std(values_ip[-10:]) if len(values_ip) >= 10 else np.std(values_ip)
-
-    score = 0.0
-    if abs(zs) > 2.0:
-        score += 1.0
-        out['signals'].append('zscore')
-    if abs(mom_v) > 0.0005:
-        score += 1.0
-        out['signals'].append('momentum')
-    if vol > 0.02:
-        score += 0.5
-        out['signals'].append('volatility')
+    vol = arr[-10:].std()
 
     # incorporate splits if provided (heavy weight)
-    if splits and ('away_money_pct' in splits and 'home_money_pct' in splits):
-        if max(splits['away_money_pct'] or 0, splits['home_money_pct'] or 0) > 60:
-            score += 1.0
-            out['signals'].append('sharp_splits')
+    sharp = bool(splits) and 'away_money_pct' in splits and 'home_money_pct' in splits \
+        and max(splits['away_money_pct'] or 0, splits['home_money_pct'] or 0) > 60
 
-    out['confidence'] = min(1.0, score / 3.0)
-    out['steam'] = out['confidence'] > 0.4
-    return out
+    # one lane per signal, scored with a single dot product against _STEAM_WEIGHTS
+    return _steam_summary(np.array([abs(zs) > 2.0, abs(mom_v) > 0.0005, vol > 0.02, sharp]))
 
 
-def calculate_greeks_estimate(values_ip: List[float], points: Optional[List[float]] = None) -> Dict[str, Optional[float]]:
+def calculate_greeks_estimate(values_ip: Sequence[float], points: Optional[Sequence[float]] = None) -> Dict[str, Optional[float]]:
     """Estimate Greeks-like sensitivities: delta (dIP/dPoint), gamma (d2IP/dPoint2), vega ~ sensitivity to vol."""
     out = {'delta': None, 'gamma': None, 'vega': None}
-    if not values_ip or points is None or len(values_ip) < 3 or len(points) < 3:
+    if points is None:
         return out
-    dip = np.diff(values_ip)
-    dp = np.diff(points)
-    ratios = [a / b for a, b in zip(dip, dp) if abs(b) > 1e-8]
-    if not ratios:
+    ip = _as_array(values_ip)
+    pts = _as_array(points)
+    if ip.size < 3 or pts.size < 3:
         return out
-    out['delta'] = float(np.median(ratios))
+    dip = np.diff(ip)
+    dp = np.diff(pts)
+    m = min(dip.size, dp.size)
+    mask = np.abs(dp[:m]) > 1e-8
+    ratios = dip[:m][mask] / dp[:m][mask]
+    if ratios.size == 0:
+        return out
+    out['delta'] = _median(ratios)
     # gamma ~ change in delta
-    if len(ratios) >= 2:
-        out['gamma'] = float(np.median(np.diff(ratios)))
-    out['vega'] = float(np.std(dip))
+    if ratios.size >= 2:
+        out['gamma'] = _median(np.diff(ratios))
+    out['vega'] = float(dip.std())
     return out
 
 
-def implied_volatility_simple(values_ip: List[float]) -> Optional[float]:
-    if not values_ip or len(values_ip) < 2:
+def implied_volatility_simple(values_ip: Sequence[float]) -> Optional[float]:
+    arr = _as_array(values_ip)
+    if arr.size < 2:
         return None
-    returns = np.diff(values_ip)
-    return float(np.std(returns))
+    returns = np.diff(arr)
+    return float(returns.std())
+
+
+@njit(cache=True, nogil=True)
+def _bundle(arr, lookback, rsi_period, mom_period):
+    """One pass over the tail of ``arr`` for the lookback mean/std, RSI and momentum.
 
+    Returns (mu, sd, rsi, mom_v, mom_a); entries whose window doesn't fit are NaN,
+    and a lookback of 0 skips the mean/std.
+    """
+    n = arr.shape[0]
+    last = arr[n - 1]
+    nan = np.nan
+    mu = sd = rsi = mom_v = mom_a = nan
+    has_stats = lookback > 0 and n >= lookback
+    has_rsi = n >= rsi_period + 1
+    stats_from = n - lookback if has_stats else n
+    rsi_from = n - rsi_period if has_rsi else n
+    s = ss = gains = losses = 0.0
+    for i in range(min(stats_from, rsi_from), n):
+        if i >= stats_from:
+            d = arr[i] - last  # shifted by the last value to limit cancellation
+            s += d
+            ss += d * d
+        if i >= rsi_from:
+            delta = arr[i] - arr[i - 1]
+            if delta > 0:
+                gains += delta
+            else:
+                losses -= delta
+    if has_stats:
+        msq = ss / lookback
+        m = s / lookback
+        var = msq - m * m
+        mu = last + m
+        sd = 0.0 if var <= 1e-12 * msq else np.sqrt(var)
+    if has_rsi:
+        if losses == 0.0:
+            rsi = 100.0
+        else:
+            rsi = 100.0 - 100.0 / (1.0 + gains / losses)
+    if n >= mom_period + 1:
+        mom_v = (last - arr[n - mom_period - 1]) / mom_period
+        if n >= 2 * mom_period + 1:
+            prev_v = (arr[n - mom_period - 1] - arr[n - 2 * mom_period - 1]) / mom_period
+            mom_a = (mom_v - prev_v) / mom_period
+    return mu, sd, rsi, mom_v, mom_a
 
-def calculate_all_ta_indicators(series_data: List[Dict], field: str = 'ip', point_field: str = 'point') -> Dict[str, Any]:
-    values_ip = [d[field] for d in series_data if field in d and d[field] is not None]
-    values_points = [d[point_field] for d in series_data if point_field in d and d[point_field] is not None]
+
+def _opt(x: float) -> Optional[float]:
+    return None if np.isnan(x) else float(x)
+
+
+def calculate_all_ta_indicators(values_ip: Sequence[float], values_points: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+    """Full TA bundle for one market. NaN entries in ``values_points`` mark ticks without a point.
+
+    ``values_ip`` may be a RingBuf, in which case its points are used and the
+    SMA / z-score / Bollinger windows come from its running sums.
+    """
+    src = values_ip
+    if isinstance(values_ip, RingBuf):
+        values_ip, ring_points = values_ip.view()
+        if values_points is None:
+            values_points = ring_points
+    values_ip = _as_array(values_ip)
+    values_points = _as_array(values_points if values_points is not None else ())
+    values_points = values_points[~np.isnan(values_points)]
     out: Dict[str, Any] = {}
-    if not values_ip:
+    n, m = values_ip.size, values_points.size
+    if n == 0:
         return out
+    # a RingBuf already has the lookback-20 stats, so the fused pass only needs them for plain arrays
+    stats = _tail_stats(src, lookback=20) if isinstance(src, RingBuf) else None
+    mu, sd, rsi, mom_v, mom_a = _bundle(values_ip, 0 if stats is not None else 20, 14, 3)
+    if stats is None and not np.isnan(mu):
+        stats = (float(mu), float(sd))
+    # each helper below is only called once the series is long enough for it to return something
     out['current_ip'] = float(values_ip[-1])
-    out['data_points'] = len(values_ip)
-    out['momentum'] = momentum_from_ips(values_ip, period=3)
-    out['rsi'] = rsi_from_ips(values_ip, period=14)
-    out['z_score'] = z_score(values_ip, lookback=20)
-    out['sma'] = sma(values_ip, period=10)
+    out['data_points'] = int(n)
+    out['momentum'] = {'MOM_V': _opt(mom_v), 'MOM_A': _opt(mom_a)}
+    out['rsi'] = _opt(rsi)
+    out['z_score'] = z_score(values_ip, lookback=20, stats=stats) if stats is not None else None
+    out['sma'] = sma(src, period=10)
     out['ema'] = ema(values_ip, period=10)
     out['adaptive_ma'] = adaptive_ma(values_ip)
-    out['bollinger_width'] = bollinger_width(values_ip, lookback=20)
-    out['atr'] = atr_on_points(values_points, lookback=14) if values_points else None
-    out['fib_retracement'] = fibonacci_levels(values_points, lookback=50) if values_points else {}
-    out['fib_extensions'] = fibonacci_extensions(values_points, lookback=50) if values_points else {}
-    out['steam_detection'] = detect_steam_movement_advanced(values_ip, values_points)
-    out['greeks'] = calculate_greeks_estimate(values_ip, values_points) if values_points else {}
-    out['implied_volatility'] = implied_volatility_simple(values_ip)
-    out['series'] = values_ip[-500:]
+    out['bollinger_width'] = bollinger_width(values_ip, lookback=20, stats=stats) if stats is not None else None
+    out['atr'] = atr_on_points(values_points, lookback=14) if m >= 2 else None
+    out['fib_retracement'] = fibonacci_levels(values_points, lookback=50) if m >= 2 else {}
+    out['fib_extensions'] = fibonacci_extensions(values_points, lookback=50) if m >= 2 else {}
+    out['steam_detection'] = detect_steam_movement_advanced(values_ip, values_points, stats=stats) if n >= 6 else _steam_summary()
+    if not m:
+        out['greeks'] = {}
+    elif n >= 3 and m >= 3:
+        out['greeks'] = calculate_greeks_estimate(values_ip, values_points)
+    else:
+        out['greeks'] = {'delta': None, 'gamma': None, 'vega': None}
+    out['implied_volatility'] = implied_volatility_simple(values_ip) if n >= 2 else None
+    out['series'] = values_ip[-500:].tolist()
     return out
+
+
+# compile the jitted kernels at import so the first parse doesn't pay for it
+_ema_kernel(np.zeros(2), 0.5)
+_adaptive_ma_kernel(np.zeros(2), 10, 30, 2.0)
+_bundle(np.zeros(2), 20, 14, 3)